@@ -79,7 +79,7 @@ class QMatrixClust:
                 result is used as the cutoff in both algorithms.
 
             profile_mat_gen (bool, optional): Specifies if Q matrix
-            generation needs to be timed using python's time.time()
+            generation needs to be timed using python's time.perf_counter()
         """
         if not clust_dist_sparse_params:
             self.clust_dist_sparse_params = {"do_sparse": False,
@@ -98,12 +98,12 @@ class QMatrixClust:
         self.dist_proxy_sparsity = 0.
         self.time_to_gen_mat = 0.
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.matrix, self.dist_sparsity, self.dist_proxy_sparsity = \
             self._gen_Q_matrix(input_nodes, lambda_dist, lambda_points,
                                lambda_centers)
         if profile_mat_gen:
-            self.time_to_gen_mat = time.time() - start_time
+            self.time_to_gen_mat = time.perf_counter() - start_time
 
     @staticmethod
     def _compute_matrix_sparsity(mat: npty.NDArray):
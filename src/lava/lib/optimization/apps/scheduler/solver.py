@@ -175,9 +175,9 @@ class Scheduler:
 
     def solve_with_netx(self):
         """ Find an approximate maximum independent set using networkx. """
-        start_time = time.time()
+        start_time = time.perf_counter()
         solution = maximum_independent_set(self.graph)
-        self.netx_time = time.time() - start_time
+        self.netx_time = time.perf_counter() - start_time
         solution = np.array(list(solution))
         self._netx_solution = np.zeros((solution.size, 4))
         nds = self.graph.nodes
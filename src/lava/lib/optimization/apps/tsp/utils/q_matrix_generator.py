@@ -53,7 +53,7 @@ class QMatrixTSP:
             `fixed_pt =True`.
 
             profile_mat_gen (bool, optional): Specifies if Q matrix
-            generation needs to be timed using python's time.time()
+            generation needs to be timed using python's time.perf_counter()
         """
 
         self.fixed_pt = fixed_pt
@@ -61,12 +61,12 @@ class QMatrixTSP:
         self.max_fixed_pt_mant = fixed_pt_range[1]
         self.time_to_gen_mat = 0.
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.matrix = self._gen_Q_matrix(
             input_nodes, lamda_dist, lamda_cnstrt
         )
         if profile_mat_gen:
-            self.time_to_gen_mat = time.time() - start_time
+            self.time_to_gen_mat = time.perf_counter() - start_time
 
     def _gen_Q_matrix(self, input_nodes, lamda_dist, lamda_cnstrnt):
         """Return the Q matrix that sets up the QUBO for the clustering
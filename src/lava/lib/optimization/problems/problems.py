@@ -124,8 +124,10 @@ class QUBO(OptimizationProblem):
             raise NotImplementedError(
                 "Non integer q matrices are not supported yet."
             )
-        # matrix must be symmetric for current implementation
-        if not np.allclose(q, q.T, rtol=1e-05, atol=1e-08):
+        # matrix must be symmetric for current implementation; q is an int
+        # matrix at this point, so compare exactly instead of via allclose,
+        # which would cast both operands to float and allocate temporaries.
+        if not np.array_equal(q, q.T):
             raise NotImplementedError(
                 "Only symmetric matrixes are currently supported."
             )
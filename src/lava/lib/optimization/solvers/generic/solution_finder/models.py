@@ -59,22 +59,21 @@ class SolutionFinderModel(AbstractSubProcessModel):
         # Subprocesses
         self.variables = VariablesImplementation()
         if discrete_var_shape is not None:
+            q_off = self._get_q_off(cost_coefficients)
 
             self.variables.discrete = DiscreteVariablesProcess(
                 shape=discrete_var_shape,
                 cost_diagonal=cost_diagonal,
-                cost_off_diagonal=self._get_q_off(cost_coefficients),
+                cost_off_diagonal=q_off,
                 hyperparameters=hyperparameters,
             )
 
             self.cost_minimizer = None
             self.cost_convergence_check = None
             if cost_coefficients is not None:
-                weights = self._get_q_off(cost_coefficients)
-
                 self.cost_minimizer = CostMinimizer(
                     Sparse(
-                        weights=csr_matrix(weights),
+                        weights=csr_matrix(q_off),
                         num_message_bits=24,
                     )
                 )
@@ -173,6 +172,6 @@ class SolutionFinderModel(AbstractSubProcessModel):
     def _get_q_off(self, cost_coefficients) -> npty.ArrayLike:
         """Returns the off-diagonal elements of the Q matrix"""
 
-        q_off_diag = cost_coefficients[2].init * np.logical_not(
-            np.eye(*cost_coefficients[2].init.shape))
+        q_off_diag = np.array(cost_coefficients[2].init, copy=True)
+        np.fill_diagonal(q_off_diag, 0)
         return q_off_diag
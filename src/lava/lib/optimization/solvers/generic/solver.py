@@ -408,7 +408,7 @@ class OptimizationSolver:
         return [CPU] if backend in CPUS else [Loihi2NeuroCore], LoihiProtocol
 
     def _get_probing(
-        self, config: SolverConfig()
+        self, config: SolverConfig
     ) -> ty.Tuple[np.ndarray, np.ndarray]:
         """
         Return the cost and state timeseries if probed.
@@ -3,12 +3,16 @@
 # See: https://spdx.org/licenses/
 
 
+import typing as ty
+
 import numpy as np
 import numpy.typing as npt
-import networkx as netx
 
 from lava.lib.optimization.problems.problems import QUBO
 
+if ty.TYPE_CHECKING:
+    import networkx as netx
+
 
 class MISProblem:
     """
@@ -53,6 +57,9 @@ class MISProblem:
 
     @staticmethod
     def _get_graph_from_adjacency_matrix(adjacency_matrix):
+        # networkx is only needed for graph export and is slow to import.
+        import networkx as netx
+
         num_vertices = adjacency_matrix.shape[0]
         # create Graph
         G = netx.Graph()
@@ -72,6 +79,62 @@ class MISProblem:
         adj_mc = adj_mc - np.diag(adj_mc.diagonal())
         return adj_mc
 
+    @staticmethod
+    def _find_maximum_clique(adjacency_matrix: np.ndarray) -> ty.List[int]:
+        """
+        Branch-and-bound search for a maximum clique with greedy coloring
+        bounds (Tomita's MCQ). Neighborhoods and candidate sets are stored as
+        integer bitsets so that set operations reduce to word-wise bit
+        manipulation instead of Python-level set operations.
+        """
+        num_vertices = adjacency_matrix.shape[0]
+        # Visit vertices by decreasing degree, which tightens the coloring
+        # bound early on.
+        by_degree = np.argsort(-adjacency_matrix.sum(axis=1), kind='stable')
+        adjacency_matrix = adjacency_matrix[np.ix_(by_degree, by_degree)]
+        packed = np.packbits(adjacency_matrix.astype(bool), axis=1,
+                             bitorder='little')
+        neighbors = [int.from_bytes(row.tobytes(), 'little') & ~(1 << v)
+                     for v, row in enumerate(packed)]
+        best = []
+
+        def color_sort(candidates):
+            # Greedily partition the candidates into independent sets. A
+            # clique contains at most one vertex of each color, so the color
+            # of a vertex bounds the size of any clique extending through it.
+            order, colors = [], []
+            color = 0
+            uncolored = candidates
+            while uncolored:
+                color += 1
+                available = uncolored
+                while available:
+                    v = (available & -available).bit_length() - 1
+                    uncolored &= ~(1 << v)
+                    available &= ~(1 << v) & ~neighbors[v]
+                    order.append(v)
+                    colors.append(color)
+            return order, colors
+
+        def expand(clique, candidates):
+            nonlocal best
+            order, colors = color_sort(candidates)
+            for v, color in zip(reversed(order), reversed(colors)):
+                if len(clique) + color <= len(best):
+                    return
+                clique.append(v)
+                new_candidates = candidates & neighbors[v]
+                if new_candidates:
+                    expand(clique, new_candidates)
+                elif len(clique) > len(best):
+                    best = list(clique)
+                clique.pop()
+                candidates &= ~(1 << v)
+
+        if num_vertices > 0:
+            expand([], (1 << num_vertices) - 1)
+        return [int(by_degree[v]) for v in best]
+
     @staticmethod
     def _get_qubo_cost_from_adjacency(adjacency_matrix: np.ndarray,
                                       w_diag: float,
@@ -80,11 +143,13 @@ class MISProblem:
             raise ValueError(
                 "Off-diagonal weights must be > 2 x diagonal weights.")
 
-        num_variables = adjacency_matrix.shape[0]
-        q = - w_diag * np.eye(num_variables) + w_off / 2 * adjacency_matrix
+        # Build Q in place from the adjacency matrix to avoid allocating a
+        # dense identity matrix and an intermediate sum.
+        q = np.multiply(adjacency_matrix, w_off / 2)
+        q[np.diag_indices_from(q)] -= w_diag
         return q.astype(int)
 
-    def get_graph(self) -> netx.Graph:
+    def get_graph(self) -> "netx.Graph":
         """Returns the graph in networkx format."""
         graph = self._get_graph_from_adjacency_matrix(self._adjacency)
         return graph
@@ -93,7 +158,7 @@ class MISProblem:
         """Returns the adjacency matrix of the graph."""
         return self._adjacency
 
-    def get_complement_graph(self) -> netx.Graph:
+    def get_complement_graph(self) -> "netx.Graph":
         """Returns the complement graph in networkx format."""
         c_adjacency = self.get_complement_graph_matrix()
         c_graph = self._get_graph_from_adjacency_matrix(c_adjacency)
@@ -167,8 +232,8 @@ class MISProblem:
         the maximal independent set. A maximal independent set is an
         independent set that is not a subset of any other independent set.
         The largest of these sets is the maximum independent set, which is
-        determined by the present function.*Uses Networkx to solve the
-        equivalent maximum clique problem.
+        determined by the present function.* Solves the equivalent maximum
+        clique problem with a bitset branch-and-bound search.
 
         Get a graph whose maximum clique corresponds to the maximum independent
         set of that defined by the input connectivity matrix.
@@ -182,8 +247,8 @@ class MISProblem:
             The ith entry of the vector determines if the ith vertex is a
             member of the MIS.
         """
-        c_graph = self.get_complement_graph()
-        maximum_clique, weights = netx.max_weight_clique(c_graph, weight=None)
+        c_adjacency = self.get_complement_graph_matrix()
+        maximum_clique = self._find_maximum_clique(c_adjacency)
 
         # convert array of indices to binary array
         mis = np.zeros((self.num_vertices,))
@@ -138,6 +138,11 @@ class TestQUBO(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.qubo.validate_input(np.eye(10).reshape(5, 20))
 
+    def test_assertion_raised_if_q_is_not_symmetric(self):
+        q = np.triu(np.ones((10, 10), dtype=int))
+        with self.assertRaises(NotImplementedError):
+            QUBO(q)
+
     def test_validate_input_method_does_not_fail_assertion(self):
         try:
             self.qubo.validate_input(np.eye(10, dtype=int))
@@ -4,6 +4,7 @@
 
 import unittest
 import numpy as np
+import networkx as netx
 
 from lava.lib.optimization.solvers.generic.solver import (
     OptimizationSolver, SolverConfig
@@ -95,12 +96,36 @@ class TestMISProblem(unittest.TestCase):
         self.assertTrue(np.all(qubo.q[np.diag_indices(10)] == -w_diag))
         self.assertTrue(np.all(qubo.q[qubo.q > 0] == w_off / 2))
 
+    def test_get_qubo_matrix(self):
+        """Tests the QUBO matrix is an int matrix with the correct weights."""
+        w_diag = 1
+        w_off = 8
+        q = self.problem.get_qubo_matrix(w_diag, w_off)
+        adjacency = self.problem.get_graph_matrix()
+        self.assertTrue(issubclass(q.dtype.type, np.integer))
+        self.assertTrue(np.all(q[np.diag_indices(10)] == -w_diag))
+        off_diag = np.logical_not(np.eye(10, dtype=bool))
+        self.assertTrue(np.all(q[off_diag] == w_off / 2 * adjacency[off_diag]))
+
     def test_find_maximum_independent_set(self):
         """Tests the correct maximum independent set is returned."""
         mis = self.problem.find_maximum_independent_set()
         correct_set_size = 2
         self.assertEqual(mis.sum(), correct_set_size)
 
+    def test_find_maximum_independent_set_larger_graph(self):
+        """Tests the maximum independent set of a larger graph is independent
+        and as large as the maximum clique of the complement graph found by
+        networkx."""
+        problem = MISProblem(num_vertices=40, connection_prob=0.5, seed=7)
+        mis = problem.find_maximum_independent_set()
+        adjacency = problem.get_graph_matrix()
+        members = np.flatnonzero(mis)
+        self.assertEqual(adjacency[np.ix_(members, members)].sum(), 0)
+        clique, _ = netx.max_weight_clique(problem.get_complement_graph(),
+                                           weight=None)
+        self.assertEqual(mis.sum(), len(clique))
+
 
 if __name__ == "__main__":
     unittest.main()